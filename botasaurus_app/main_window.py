@@ -11,7 +11,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QThread, Signal, QTimer
 from PySide6.QtGui import QFont, QColor
 from profile_manager import ProfileManager
-from scraper_runner import ScraperRunner, ScraperThread, CheckProxyThread, ManualBrowserThread, MexcLoginThread, MexcShortThread, MexcLongThread
+from scraper_runner import ScraperRunner, ManualBrowserThread, MexcLoginThread, MexcShortThread, MexcLongThread
 import json
 import pyotp
 import time
@@ -1106,6 +1106,7 @@ class MainWindow(QMainWindow):
         """Generate a sample Excel file with example profiles"""
         import os
         from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Font, PatternFill, Alignment
 
         # Get save location
@@ -1121,21 +1122,29 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            # Create workbook
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Profiles"
+            # Create workbook (write-only: rows stream straight to the file)
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Profiles")
+
+            # Adjust column widths (must be set before the first row is written)
+            ws.column_dimensions['A'].width = 25
+            ws.column_dimensions['B'].width = 18
+            ws.column_dimensions['C'].width = 40
+            ws.column_dimensions['D'].width = 20
 
             # Headers
             headers = ["email", "password", "proxy", "2fa_secret"]
             header_fill = PatternFill(start_color="1976D2", end_color="1976D2", fill_type="solid")
             header_font = Font(color="FFFFFF", bold=True)
 
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
+            header_cells = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
                 cell.fill = header_fill
                 cell.font = header_font
                 cell.alignment = Alignment(horizontal="center")
+                header_cells.append(cell)
+            ws.append(header_cells)
 
             # Sample data
             samples = [
@@ -1146,15 +1155,8 @@ class MainWindow(QMainWindow):
                 ["user5@example.com", "demo12345", "123.45.67.89:8080", "KZXW6YTBOI5HS2TN"],
             ]
 
-            for row_num, row_data in enumerate(samples, 2):
-                for col_num, value in enumerate(row_data, 1):
-                    ws.cell(row=row_num, column=col_num, value=value)
-
-            # Adjust column widths
-            ws.column_dimensions['A'].width = 25
-            ws.column_dimensions['B'].width = 18
-            ws.column_dimensions['C'].width = 40
-            ws.column_dimensions['D'].width = 20
+            for row_data in samples:
+                ws.append(row_data)
 
             # Save file
             wb.save(file_path)
@@ -2032,8 +2034,7 @@ class MainWindow(QMainWindow):
                 thread = thread_info['thread']
                 if thread.isRunning():
                     self.log(f"⏳ Waiting for trade thread: {thread_info['email']}")
-                    thread.quit()  # Exit exec() loop
-                    thread.wait(5000)  # Wait max 5 seconds
+                    thread.wait(5000)  # Wait max 5 seconds (run() returns after the last step)
 
                     # If still running after timeout, terminate
                     if thread.isRunning():
@@ -2043,6 +2044,11 @@ class MainWindow(QMainWindow):
 
             self.active_trade_threads.clear()
 
+        # Close the profile browsers of scrapes, checks, logins and trades (held by the runner)
+        if self.scraper_runner.active_drivers:
+            self.log("🌐 Closing profile browsers...")
+            self.scraper_runner.close_all_drivers()
+
         # Close all active browsers and stop threads
         if self.active_drivers:
             self.log("🌐 Closing active browsers and threads...")
@@ -2057,10 +2063,10 @@ class MainWindow(QMainWindow):
                     # Close browser
                     driver.close()
 
-                    # Stop thread event loop (if thread is using exec())
+                    # Stop the ManualBrowserThread's event loop (it idles in exec() to keep the Driver)
                     if thread:
                         self.log(f"⏹️ Stopping thread for: {email}")
-                        thread.quit()  # Exit exec() loop
+                        thread.quit()  # Exit ManualBrowserThread.exec() loop
                         thread.wait(2000)  # Wait max 2 seconds
 
                 except Exception as e: